@@ -1,10 +1,17 @@
 """REST authentication handling."""
 
+import base64
+import hashlib
+import json
 import os
-from typing import Any
-
-import boto3
-from requests_aws4auth import AWS4Auth
+import threading
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict
+
+import requests
+from requests.adapters import HTTPAdapter
 from singer_sdk.authenticators import (
     APIAuthenticatorBase,
     APIKeyAuthenticator,
@@ -13,6 +20,143 @@ from singer_sdk.authenticators import (
     OAuthAuthenticator,
 )
 
+# Environment fallbacks for the AWS connection settings, snapshotted once
+# at import so every AWSConnectClient construction avoids a round of
+# encode/decode trips through the os.environ mapping. Long-running
+# processes that change their environment can call refresh_env().
+_AWS_ENV_KEYS = (
+    "AWS_PROFILE",
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "AWS_SESSION_TOKEN",
+    "AWS_REGION",
+    "AWS_SERVICE",
+)
+_ENV: Dict[str, Any] = {}
+
+
+def refresh_env() -> None:
+    """Refresh the snapshot of AWS related environment variables.
+
+    Returns:
+        The None.
+
+    """
+    for key in _AWS_ENV_KEYS:
+        _ENV[key] = os.environ.get(key)
+
+
+refresh_env()
+
+# Note: boto3 and botocore are imported lazily inside AWSConnectClient and
+# BotoSigV4Auth. Importing boto3 parses the large botocore data files
+# (several hundred ms of start-up time), which taps not using AWS auth
+# should never pay.
+
+# Shared OAuth token cache. select_authenticator constructs a fresh
+# authenticator per stream, so tokens are cached at module level keyed by a
+# SHA-256 hash of the auth endpoint and credentials (never the plaintext
+# secrets) and reused until close to expiry. Entries are (access_token,
+# expires_at) pairs.
+_oauth_token_cache: Dict[str, tuple] = {}
+
+# Refresh a token this many seconds before its reported expiry so an
+# in-flight request cannot fail with a token that expires mid-request.
+OAUTH_EXPIRY_SAFETY_BUFFER_SECS = 300
+
+# Upper bound on how long a cached token is trusted when the authorization
+# server reports a very long expiry or none at all.
+OAUTH_CACHE_TTL_SECS = 55 * 60
+
+# Serialises token refreshes so concurrent streams sharing expired
+# credentials perform a single token end-point request; waiters pick the
+# fresh token up from the cache once the leader releases the lock.
+_oauth_refresh_lock = threading.Lock()
+
+# Shared HTTP session for token end-point requests. Reusing one session
+# keeps the TCP/TLS connection alive between token refreshes instead of
+# paying a fresh handshake per request, and the mounted adapter lets
+# concurrent streams share pooled connections.
+_auth_http_session = requests.Session()
+_auth_http_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+_auth_http_session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+# Cache of boto3 sessions keyed by the resolved connection settings (the
+# secret key is hashed, never stored raw). Session construction parses the
+# botocore config and endpoint data files and may call STS, so one session
+# is shared by every AWSConnectClient with the same settings. boto3 already
+# refreshes the session credentials internally, so they are safe to reuse.
+_aws_session_cache: Dict[tuple, Any] = {}
+
+
+def resolve_config(self) -> Any:
+    """Return the config for a tap, stream or authenticator, cached on self.
+
+    The config may live on self.config (Tap Config) or self._config (Stream
+    Config). The outcome is resolved once and stashed on the instance so
+    subsequent calls are a single attribute load rather than truthiness
+    tests against potentially large dicts.
+
+    Returns:
+        The resolved config mapping, or an empty dict if neither is set.
+
+    """
+    my_config = getattr(self, "_resolved_config", None)
+    if my_config is None:
+        if self.config:  # Tap Config
+            my_config = self.config
+        elif self._config:  # Stream Config
+            my_config = self._config
+        else:
+            my_config = {}
+        self._resolved_config = my_config
+    return my_config
+
+
+class BotoSigV4Auth(requests.auth.AuthBase):
+    """A requests auth adapter signing requests with botocore's SigV4 signer.
+
+    botocore's SigV4Auth implements the same AWS4 signing algorithm as
+    requests_aws4auth, but its SHA-256/HMAC work runs through the
+    OpenSSL-backed hashlib/hmac C extensions shipped with botocore and is
+    maintained alongside the AWS SDK.
+    """
+
+    def __init__(self, credentials, aws_service, region):
+        """Class initialization.
+
+        Args:
+            credentials: botocore credentials from a boto3 session.
+            aws_service: the AWS service being signed for e.g. es.
+            region: the AWS region being signed for e.g. us-east-1.
+
+        """
+        from botocore.auth import SigV4Auth
+
+        self._signer = SigV4Auth(credentials, aws_service, region)
+
+    def __call__(self, request):
+        """Sign the prepared request with AWS Signature Version 4.
+
+        Args:
+            request: a requests.PreparedRequest to sign.
+
+        Returns:
+            The request with the SigV4 auth headers applied.
+
+        """
+        from botocore.awsrequest import AWSRequest
+
+        aws_request = AWSRequest(
+            method=request.method,
+            url=request.url,
+            data=request.body,
+            headers=dict(request.headers),
+        )
+        self._signer.add_auth(aws_request)
+        request.headers.update(dict(aws_request.headers))
+        return request
+
 
 class AWSConnectClient:
     """A connection class to AWS Resources."""
@@ -20,8 +164,12 @@ class AWSConnectClient:
     def __init__(self, connection_config, create_signed_credentials: bool = True):
         self.connection_config = connection_config
 
-        # Initialise the variables
-        self.create_signed_credentials = create_signed_credentials
+        # Initialise the variables. All configuration-derived settings are
+        # resolved here, up front, so the rest of the setup only reads
+        # instance attributes.
+        self.create_signed_credentials = create_signed_credentials and bool(
+            (connection_config or {}).get("create_signed_credentials", True)
+        )
         self.aws_auth = None
         self.region = None
         self.credentials = None
@@ -35,39 +183,49 @@ class AWSConnectClient:
         self._store_aws4auth_credentials()
 
     def _create_aws_client(self, config=None):
+        import boto3
+
         if not config:
             config = self.connection_config
 
         # Get the required parameters from config file and/or environment variables
-        aws_profile = config.get("aws_profile") or os.environ.get("AWS_PROFILE")
-        aws_access_key_id = config.get("aws_access_key_id") or os.environ.get(
-            "AWS_ACCESS_KEY_ID"
+        aws_profile = config.get("aws_profile") or _ENV["AWS_PROFILE"]
+        aws_access_key_id = config.get("aws_access_key_id") or _ENV["AWS_ACCESS_KEY_ID"]
+        aws_secret_access_key = (
+            config.get("aws_secret_access_key") or _ENV["AWS_SECRET_ACCESS_KEY"]
         )
-        aws_secret_access_key = config.get("aws_secret_access_key") or os.environ.get(
-            "AWS_SECRET_ACCESS_KEY"
+        aws_session_token = config.get("aws_session_token") or _ENV["AWS_SESSION_TOKEN"]
+        aws_region = config.get("aws_region") or _ENV["AWS_REGION"]
+        self.aws_service = config.get("aws_service", None) or _ENV["AWS_SERVICE"]
+
+        session_cache_key = (
+            aws_profile,
+            aws_access_key_id,
+            (
+                hashlib.sha256(aws_secret_access_key.encode()).hexdigest()
+                if aws_secret_access_key
+                else None
+            ),
+            aws_session_token,
+            aws_region,
         )
-        aws_session_token = config.get("aws_session_token") or os.environ.get(
-            "AWS_SESSION_TOKEN"
-        )
-        aws_region = config.get("aws_region") or os.environ.get("AWS_REGION")
-        self.aws_service = config.get("aws_service", None) or os.environ.get(
-            "AWS_SERVICE"
-        )
-
-        if not config.get("create_signed_credentials", True):
-            self.create_signed_credentials = False
 
+        # Reuse a previously constructed session for the same settings
+        if session_cache_key in _aws_session_cache:
+            self.aws_session = _aws_session_cache[session_cache_key]
         # AWS credentials based authentication
-        if aws_access_key_id and aws_secret_access_key:
+        elif aws_access_key_id and aws_secret_access_key:
             self.aws_session = boto3.session.Session(
                 aws_access_key_id=aws_access_key_id,
                 aws_secret_access_key=aws_secret_access_key,
                 region_name=aws_region,
                 aws_session_token=aws_session_token,
             )
+            _aws_session_cache[session_cache_key] = self.aws_session
         # AWS Profile based authentication
         elif aws_profile:
             self.aws_session = boto3.session.Session(profile_name=aws_profile)
+            _aws_session_cache[session_cache_key] = self.aws_session
         else:
             self.aws_session = None
 
@@ -85,12 +243,8 @@ class AWSConnectClient:
 
         """
         if self.create_signed_credentials and self.credentials:
-            self.aws_auth = AWS4Auth(
-                self.credentials.access_key,
-                self.credentials.secret_key,
-                self.region,
-                self.aws_service,
-                aws_session=self.credentials.token,
+            self.aws_auth = BotoSigV4Auth(
+                self.credentials, self.aws_service, self.region
             )
         else:
             self.aws_auth = None
@@ -114,9 +268,181 @@ class AWSConnectClient:
         return self.aws_session.client(self.aws_service, region_name=self.region)
 
 
+@lru_cache(maxsize=8)
+def _basic_auth_header(username: str, password: str) -> str:
+    """Return the Basic Authorization header for the given credentials.
+
+    Cached so the base64 encoding runs once per credential pair rather than
+    on every authenticator construction.
+
+    Args:
+        username: API username.
+        password: API password.
+
+    Returns:
+        The value for the Authorization header.
+
+    """
+    credentials = f"{username}:{password}".encode()
+    return "Basic " + base64.b64encode(credentials).decode("ascii")
+
+
+class CachedBasicAuthenticator(BasicAuthenticator):
+    """Basic Authenticator with a cached Authorization header."""
+
+    def __init__(self, stream, username: str, password: str) -> None:
+        """Class initialization.
+
+        Bypasses the BasicAuthenticator initialiser so the Authorization
+        header comes from the _basic_auth_header cache instead of being
+        re-encoded per construction.
+
+        Args:
+            stream: The stream instance to use with this authenticator.
+            username: API username.
+            password: API password.
+
+        """
+        APIAuthenticatorBase.__init__(self, stream=stream)
+        self.auth_headers.update(
+            {"Authorization": _basic_auth_header(username, password)}
+        )
+
+
 class ConfigurableOAuthAuthenticator(OAuthAuthenticator):
     """Configurable OAuth Authenticator."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Class initialization.
+
+        Args:
+            args: positional arguments for the OAuthAuthenticator.
+            kwargs: keyword arguments for the OAuthAuthenticator.
+
+        """
+        super().__init__(*args, **kwargs)
+        self._token_expires_at: float = 0.0
+
+    @property
+    def _credentials_key(self) -> str:
+        """Return the shared token cache key for this authenticator.
+
+        The auth endpoint and credentials are hashed so secrets are not
+        held as plaintext dictionary keys.
+
+        Returns:
+            A SHA-256 hex digest identifying the endpoint and credentials.
+
+        """
+        raw = ":".join(
+            str(self.config.get(k, ""))
+            for k in (
+                "client_id",
+                "client_secret",
+                "username",
+                "password",
+                "refresh_token",
+                "grant_type",
+                "scope",
+                "redirect_uri",
+            )
+        )
+        # oauth_extras is a dict; serialise it with sorted keys so the same
+        # extras always hash to the same cache key.
+        oauth_extras = json.dumps(self.config.get("oauth_extras") or {}, sort_keys=True)
+        return hashlib.sha256(
+            f"{self._auth_endpoint}:{raw}:{oauth_extras}".encode()
+        ).hexdigest()
+
+    def is_token_valid(self) -> bool:
+        """Check whether the cached OAuth token can still be used.
+
+        A token is treated as expired OAUTH_EXPIRY_SAFETY_BUFFER_SECS before
+        its reported expiry, so it is refreshed ahead of time rather than
+        re-requested on every call (the SDK default when no expiry has been
+        tracked).
+
+        Returns:
+            True if the token is fresh enough to use.
+
+        """
+        if self.access_token is None:
+            return False
+        if not self._token_expires_at:
+            return super().is_token_valid()
+        return time.time() < self._token_expires_at
+
+    def update_access_token(self) -> None:
+        """Update the access token, reusing a cached token when still fresh.
+
+        Consults the module-level token cache before hitting the token
+        end-point, so authenticators constructed later (e.g. for subsequent
+        streams) reuse a previously obtained token instead of paying a token
+        end-point round-trip each.
+
+        """
+        cache_key = self._credentials_key
+        cached = _oauth_token_cache.get(cache_key)
+        if cached and time.time() < cached[1]:
+            self.access_token, self._token_expires_at = cached
+            return
+
+        with _oauth_refresh_lock:
+            # Re-check under the lock: another stream may have refreshed the
+            # token while this one was waiting to acquire it.
+            cached = _oauth_token_cache.get(cache_key)
+            if cached and time.time() < cached[1]:
+                self.access_token, self._token_expires_at = cached
+                return
+
+            self._request_token()
+
+            if self.expires_in:
+                safety_buffer = min(
+                    OAUTH_EXPIRY_SAFETY_BUFFER_SECS, self.expires_in // 2
+                )
+                ttl = min(self.expires_in - safety_buffer, OAUTH_CACHE_TTL_SECS)
+            else:
+                ttl = OAUTH_CACHE_TTL_SECS
+            self._token_expires_at = time.time() + ttl
+            _oauth_token_cache[cache_key] = (
+                self.access_token,
+                self._token_expires_at,
+            )
+
+    def _request_token(self) -> None:
+        """Request a fresh token from the token end-point.
+
+        Mirrors the SDK token request but issues it over the shared pooled
+        HTTP session, so successive refreshes reuse the existing TCP/TLS
+        connection rather than opening a new one per call.
+
+        Raises:
+            RuntimeError: if the OAuth login fails.
+
+        """
+        request_time = datetime.now(timezone.utc)
+        token_response = _auth_http_session.post(
+            self.auth_endpoint,
+            headers=self._oauth_headers,
+            data=self.oauth_request_payload,
+            timeout=60,
+        )
+        try:
+            token_response.raise_for_status()
+        except requests.HTTPError as ex:
+            raise RuntimeError(
+                f"Failed OAuth login, response was '{token_response.json()}'. {ex}"
+            ) from ex
+
+        self.logger.info("OAuth authorization attempt was successful.")
+
+        token_json = token_response.json()
+        self.access_token = token_json["access_token"]
+        expiration = token_json.get("expires_in", self._default_expiration)
+        self.expires_in = int(expiration) if expiration else None
+        self.last_refreshed = request_time
+
     def get_initial_oauth_token(self):
         """Get oauth token for the tap schema discovery.
 
@@ -136,10 +462,7 @@ class ConfigurableOAuthAuthenticator(OAuthAuthenticator):
         flow set by the grant_type.
         """
         # Test where the config is located in self
-        if self.config:  # Tap Config
-            my_config = self.config
-        elif self._config:  # Stream Config
-            my_config = self._config
+        my_config = resolve_config(self)
 
         client_id = my_config.get("client_id")
         client_secret = my_config.get("client_secret")
@@ -200,6 +523,117 @@ class ConfigurableOAuthAuthenticator(OAuthAuthenticator):
         return oauth_params
 
 
+def _build_api_key_authenticator(stream, my_config, auth_headers) -> Any:
+    """Build an API Key Authenticator, keys are extracted from api_keys dict.
+
+    Args:
+        stream: the tap or stream requiring authentication.
+        my_config: the resolved tap or stream config.
+        auth_headers: optional headers required for the auth request.
+
+    Returns:
+        An APIKeyAuthenticator.
+
+    """
+    api_keys = my_config.get("api_keys", "")
+    key, value = next(iter(api_keys.items())) if api_keys else ("", "")
+    return APIKeyAuthenticator(stream=stream, key=key, value=value)
+
+
+def _build_basic_authenticator(stream, my_config, auth_headers) -> Any:
+    """Build a Basic Authenticator.
+
+    Args:
+        stream: the tap or stream requiring authentication.
+        my_config: the resolved tap or stream config.
+        auth_headers: optional headers required for the auth request.
+
+    Returns:
+        A CachedBasicAuthenticator.
+
+    """
+    return CachedBasicAuthenticator(
+        stream=stream,
+        username=my_config.get("username", ""),
+        password=my_config.get("password", ""),
+    )
+
+
+def _build_oauth_authenticator(stream, my_config, auth_headers) -> Any:
+    """Build an OAuth Authenticator.
+
+    Args:
+        stream: the tap or stream requiring authentication.
+        my_config: the resolved tap or stream config.
+        auth_headers: optional headers required for the auth request.
+
+    Returns:
+        A ConfigurableOAuthAuthenticator.
+
+    """
+    return ConfigurableOAuthAuthenticator(
+        stream=stream,
+        auth_endpoint=my_config.get("access_token_url", ""),
+        oauth_scopes=my_config.get("scope", ""),
+        default_expiration=my_config.get("oauth_expiration_secs", ""),
+        oauth_headers=auth_headers,
+    )
+
+
+def _build_bearer_token_authenticator(stream, my_config, auth_headers) -> Any:
+    """Build a Bearer Token Authenticator.
+
+    Args:
+        stream: the tap or stream requiring authentication.
+        my_config: the resolved tap or stream config.
+        auth_headers: optional headers required for the auth request.
+
+    Returns:
+        A BearerTokenAuthenticator.
+
+    """
+    return BearerTokenAuthenticator(
+        stream=stream,
+        token=my_config.get("bearer_token", ""),
+    )
+
+
+def _build_aws_authenticator(stream, my_config, auth_headers) -> Any:
+    """Build an AWS Authenticator with Signed Credentials.
+
+    Args:
+        stream: the tap or stream requiring authentication.
+        my_config: the resolved tap or stream config.
+        auth_headers: optional headers required for the auth request.
+
+    Returns:
+        Signed AWS Credentials or None if unavailable.
+
+    """
+    # Establish an AWS Connection Client and returned Signed Credentials
+    stream.aws_connection = AWSConnectClient(
+        connection_config=my_config.get("aws_credentials", None)
+    )
+
+    if stream.aws_connection.aws_auth:
+        stream.http_auth = stream.aws_connection.aws_auth
+    else:
+        stream.http_auth = None
+
+    return stream.http_auth
+
+
+# Authenticator builders keyed by auth_method so selection is a single dict
+# lookup rather than a chain of string comparisons on every call.
+_AUTH_DISPATCH = {
+    "api_key": _build_api_key_authenticator,
+    "basic": _build_basic_authenticator,
+    "oauth": _build_oauth_authenticator,
+    "bearer_token": _build_bearer_token_authenticator,
+    "aws": _build_aws_authenticator,
+}
+
+
 def select_authenticator(self) -> Any:
     """Call an appropriate SDK Authentication method.
 
@@ -217,13 +651,9 @@ def select_authenticator(self) -> Any:
 
     """
     # Test where the config is located in self
-    if self.config:  # Tap Config
-        my_config = self.config
-    elif self._config:  # Stream Config
-        my_config = self._config
+    my_config = resolve_config(self)
 
     auth_method = my_config.get("auth_method", "")
-    api_keys = my_config.get("api_keys", "")
     self.http_auth = None
 
     # Set http headers if headers are supplied
@@ -231,49 +661,11 @@ def select_authenticator(self) -> Any:
     # In the OAUTH request.
     auth_headers = my_config.get("headers", None)
 
-    # Using API Key Authenticator, keys are extracted from api_keys dict
-    if auth_method == "api_key":
-        if api_keys:
-            for k, v in api_keys.items():
-                key = k
-                value = v
-        return APIKeyAuthenticator(stream=self, key=key, value=value)
-    # Using Basic Authenticator
-    elif auth_method == "basic":
-        return BasicAuthenticator(
-            stream=self,
-            username=my_config.get("username", ""),
-            password=my_config.get("password", ""),
-        )
-    # Using OAuth Authenticator
-    elif auth_method == "oauth":
-        return ConfigurableOAuthAuthenticator(
-            stream=self,
-            auth_endpoint=my_config.get("access_token_url", ""),
-            oauth_scopes=my_config.get("scope", ""),
-            default_expiration=my_config.get("oauth_expiration_secs", ""),
-            oauth_headers=auth_headers,
-        )
-    # Using Bearer Token Authenticator
-    elif auth_method == "bearer_token":
-        return BearerTokenAuthenticator(
-            stream=self,
-            token=my_config.get("bearer_token", ""),
-        )
-    # Using AWS Authenticator
-    elif auth_method == "aws":
-        # Establish an AWS Connection Client and returned Signed Credentials
-        self.aws_connection = AWSConnectClient(
-            connection_config=my_config.get("aws_credentials", None)
-        )
+    builder = _AUTH_DISPATCH.get(auth_method)
+    if builder:
+        return builder(self, my_config, auth_headers)
 
-        if self.aws_connection.aws_auth:
-            self.http_auth = self.aws_connection.aws_auth
-        else:
-            self.http_auth = None
-
-        return self.http_auth
-    elif auth_method != "no_auth":
+    if auth_method != "no_auth":
         self.logger.error(
             f"Unknown authentication method {auth_method}. Use api_key, basic, oauth, "
             f"bearer_token, or aws."
@@ -297,23 +689,35 @@ def get_authenticator(self) -> Any:
 
     """
     # Test where the config is located in self
-    if self.config:  # Tap Config
-        my_config = self.config
-    elif self._config:  # Stream Config
-        my_config = self._config
+    my_config = resolve_config(self)
 
     auth_method = my_config.get("auth_method", None)
-    self.http_auth = None
 
+    # Fast path: an authenticator is already cached. Only OAuth needs a
+    # token freshness check and only AWS needs http_auth repointed; every
+    # other auth method returns without re-running authenticator selection,
+    # keeping paginated fetches at one authenticator construction per
+    # stream rather than one per page.
+    if self._authenticator:
+        if auth_method == "oauth":
+            if not self._authenticator.is_token_valid():
+                # Obtain a new OAuth token as it has expired
+                self._authenticator = select_authenticator(self)
+        elif auth_method == "aws":
+            # Set the http_auth which is used in the Request call for AWS
+            if self.http_auth is not self._authenticator:
+                self.http_auth = self._authenticator
+        return
+
+    self.http_auth = None
+    self._authenticator = select_authenticator(self)
     if not self._authenticator:
-        self._authenticator = select_authenticator(self)
-        if not self._authenticator:
-            # No Auth Method, use default Authenticator
-            self._authenticator = APIAuthenticatorBase(stream=self)
-    if auth_method == "oauth":
-        if not self._authenticator.is_token_valid():
-            # Obtain a new OAuth token as it has expired
-            self._authenticator = select_authenticator(self)
+        # No Auth Method, use default Authenticator. Cached on the instance
+        # so repeated calls do not allocate a new default authenticator.
+        self._authenticator = getattr(
+            self, "_noauth_singleton", None
+        ) or APIAuthenticatorBase(stream=self)
+        self._noauth_singleton = self._authenticator
     if auth_method == "aws":
         # Set the http_auth which is used in the Request call for AWS
         self.http_auth = self._authenticator
@@ -0,0 +1,127 @@
+"""Tests auth.py features."""
+
+import time
+
+import pytest
+from singer_sdk.authenticators import (
+    APIKeyAuthenticator,
+    BasicAuthenticator,
+    BearerTokenAuthenticator,
+)
+from tap_rest_api_msdk.auth import _oauth_token_cache, select_authenticator
+from tap_rest_api_msdk.tap import TapRestApiMsdk
+
+from tests.test_streams import config
+
+TOKEN_URL = "https://auth.example.com/token"
+
+
+def stream_with_auth(extras: dict):
+    """Utility function giving a stream built with auth related config.
+
+    Args:
+        extras: auth related items to add to the basic config.
+
+    Returns:
+        A DynamicStream built from the config.
+    """
+    configs = config(extras)
+    configs["streams"][0]["schema"] = "tests/schema.json"
+    return TapRestApiMsdk(config=configs, parse_env_config=True).discover_streams()[0]
+
+
+def test_select_authenticator_api_key():
+    stream = stream_with_auth(
+        {"auth_method": "api_key", "api_keys": {"x-api-key": "secret"}}
+    )
+    authenticator = select_authenticator(stream)
+    assert isinstance(authenticator, APIKeyAuthenticator)
+    assert authenticator.auth_headers == {"x-api-key": "secret"}
+
+
+def test_select_authenticator_basic():
+    stream = stream_with_auth(
+        {"auth_method": "basic", "username": "user", "password": "pass"}
+    )
+    authenticator = select_authenticator(stream)
+    assert isinstance(authenticator, BasicAuthenticator)
+    assert authenticator.auth_headers["Authorization"].startswith("Basic ")
+
+
+def test_select_authenticator_bearer_token():
+    stream = stream_with_auth({"auth_method": "bearer_token", "bearer_token": "token"})
+    authenticator = select_authenticator(stream)
+    assert isinstance(authenticator, BearerTokenAuthenticator)
+    assert authenticator.auth_headers == {"Authorization": "Bearer token"}
+
+
+def test_select_authenticator_no_auth():
+    stream = stream_with_auth({"auth_method": "no_auth"})
+    assert select_authenticator(stream) is None
+
+
+def test_select_authenticator_unknown_method():
+    stream = stream_with_auth({"auth_method": "kerberos"})
+    with pytest.raises(ValueError):
+        select_authenticator(stream)
+
+
+def oauth_stream(client_id: str = "client_id"):
+    """Utility function giving a stream configured for OAuth.
+
+    Args:
+        client_id: the client_id to use, varied per test so the shared
+            token cache does not leak entries between tests.
+
+    Returns:
+        A DynamicStream configured for OAuth.
+    """
+    return stream_with_auth(
+        {
+            "auth_method": "oauth",
+            "access_token_url": TOKEN_URL,
+            "client_id": client_id,
+            "client_secret": "client_secret",
+            "grant_type": "client_credentials",
+        }
+    )
+
+
+def test_oauth_token_shared_across_authenticators(requests_mock):
+    _oauth_token_cache.clear()
+    requests_mock.post(TOKEN_URL, json={"access_token": "token1", "expires_in": 3600})
+    stream = oauth_stream("shared_client")
+
+    first = select_authenticator(stream)
+    second = select_authenticator(stream)
+    first.update_access_token()
+    second.update_access_token()
+
+    assert first.access_token == "token1"
+    assert second.access_token == "token1"
+    assert first.is_token_valid()
+    assert second.is_token_valid()
+    assert requests_mock.call_count == 1
+
+
+def test_oauth_token_refreshed_when_expired(requests_mock):
+    _oauth_token_cache.clear()
+    requests_mock.post(TOKEN_URL, json={"access_token": "token1", "expires_in": 3600})
+    stream = oauth_stream("expiring_client")
+
+    authenticator = select_authenticator(stream)
+    authenticator.update_access_token()
+    assert authenticator.is_token_valid()
+
+    # Expire the token on the instance and in the shared cache
+    authenticator._token_expires_at = time.time() - 1
+    cache_key, (token, _) = next(iter(_oauth_token_cache.items()))
+    _oauth_token_cache[cache_key] = (token, time.time() - 1)
+
+    assert not authenticator.is_token_valid()
+    requests_mock.post(TOKEN_URL, json={"access_token": "token2", "expires_in": 3600})
+    authenticator.update_access_token()
+
+    assert authenticator.access_token == "token2"
+    assert authenticator.is_token_valid()
+    assert requests_mock.call_count == 2